@@ -7,6 +7,7 @@ import sys
 import os
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 
@@ -15,36 +16,174 @@ from PySide6.QtWidgets import (
     QPushButton, QTextEdit, QFileDialog, QListWidget, QListWidgetItem, QLabel,
     QMenu, QInputDialog, QTreeWidget, QTreeWidgetItem, QSlider, QCheckBox
 )
-from PySide6.QtCore import Slot, Qt, QTimer
+from PySide6.QtCore import Signal, Slot, Qt, QTimer, QFileSystemWatcher
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 
 # 导入自定义模块
-from lut_processing import parse_cube_lut, ImageProcessingThread
+from lut_processing import (
+    load_cube_lut, load_dense_lut, load_image, apply_edge_preserving_debanding, finish_lut_result,
+    remove_lut_caches, save_image, ImageProcessingThread
+)
 from gui_components import AutoResizingLabel
 
 
+# 选择图片后最多预解码的张数，超出部分在批处理时再读取，限制内存占用
+_DECODE_AHEAD = 8
+
+# 暗色系样式表，模块加载时构建一次
+_QSS_DARK = """
+    QMainWindow { background-color: #1e1e1e; }
+    QWidget { color: #e0e0e0; font-family: 'Segoe UI', sans-serif; }
+
+    QPushButton {
+        background-color: #3a3a3a;
+        border: 1px solid #555;
+        border-radius: 6px;
+        color: #ffffff;
+        font-size: 14px;
+        padding: 0 15px;
+    }
+    QPushButton:hover { background-color: #4a4a4a; border-color: #666; }
+    QPushButton:pressed { background-color: #2a2a2a; border-color: #444; }
+    QPushButton:disabled { background-color: #252525; color: #666; border-color: #333; }
+
+    QTreeWidget {
+        background-color: #252526;
+        border: 1px solid #333;
+        border-radius: 6px;
+        color: #e0e0e0;
+        padding: 4px;
+        outline: none;
+        show-decoration-selected: 0;
+    }
+    QTreeWidget::item { 
+        padding: 6px 4px;
+        border-radius: 3px;
+        outline: none;
+        border: none;
+    }
+    QTreeWidget::item:selected { 
+        background-color: #3a3a3a; 
+        color: #ffffff; 
+        outline: none;
+        border: none;
+    }
+    QTreeWidget::item:focus {
+        background-color: #3a3a3a;
+        outline: none;
+        border: none;
+    }
+    QTreeWidget::item:hover { 
+        background-color: #333; 
+    }
+    QTreeWidget::branch {
+        background: transparent;
+    }
+    QTreeWidget::branch:has-children:!has-siblings:closed,
+    QTreeWidget::branch:closed:has-children:has-siblings {
+        border-image: none;
+        image: none;
+    }
+    QTreeWidget::branch:open:has-children:!has-siblings,
+    QTreeWidget::branch:open:has-children:has-siblings {
+        border-image: none;
+        image: none;
+    }
+    QTreeWidget::branch:has-siblings:!adjoins-item {
+        border-image: none;
+    }
+    QTreeWidget::branch:has-siblings:adjoins-item {
+        border-image: none;
+    }
+    QTreeWidget::branch:!has-children:!has-siblings:adjoins-item {
+        border-image: none;
+    }
+    
+    QSlider::groove:horizontal {
+        border: 1px solid #333;
+        height: 6px;
+        background: #2b2b2b;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #4a9eff;
+        border: 1px solid #3a8eef;
+        width: 14px;
+        margin: -5px 0;
+        border-radius: 7px;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #5aafff;
+    }
+    QSlider::sub-page:horizontal {
+        background: #4a9eff;
+        border: 1px solid #333;
+        height: 6px;
+        border-radius: 3px;
+    }
+
+    QTextEdit {
+        background-color: #252526;
+        border: 1px solid #333;
+        border-radius: 4px;
+        color: #cccccc;
+        font-family: Consolas, monospace;
+    }
+
+    /* 滚动条样式优化 */
+    QScrollBar:vertical {
+        border: none; background: #2b2b2b; width: 10px; margin: 0;
+    }
+    QScrollBar::handle:vertical {
+        background: #555; min-height: 20px; border-radius: 5px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
+"""
+
+
 class LutAppWindow(QMainWindow):
+    # 后台生成稠密查找表完成：(LUT 键, Future)，由工作线程发出，在界面线程处理
+    _dense_lut_ready = Signal(object, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PicLUT - Apply LUT to Images")
         self.resize(1200, 800)
 
+        # 启用 OpenCV 的 SIMD 优化与多线程，保留一个核心给界面线程
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(max(1, (os.cpu_count() or 1) - 1))
+
         # 数据状态
         self.source_image = None
+        self.preview_source = None  # 缩小后的预览用图像，仅点击“应用处理”时才处理原图
         self.processed_image = None
         self.lut_table = None
         self.lut_size = None
+        self.dense_lut = None  # 8-bit 稠密查找表，LUT 加载时预计算
+        self.lut_key = None  # (LUT 路径, 修改时间)，文件变化后预览缓存随之失效
         self.worker_thread = None
         
         # 批处理状态
         self.image_paths = []  # 存储所有选择的图片路径
-        self.loaded_images = []  # 存储加载的图片数据
+        self.batch_save_dir = None  # 批处理结果的保存文件夹，开始处理前选择
         self.batch_mode = False  # 是否处于批处理模式
         
+        # 后台解码线程池：选择图片后立即解码，与用户查看预览重叠
+        self._decode_pool = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2))
+        self._decode_futures = []  # 与 image_paths 一一对应的解码任务，未预解码的为 None
+
+        # 稠密查找表首次生成约需 0.6 秒并写入 64 MB 缓存，放到后台单线程执行，不阻塞界面
+        self._lut_bake_pool = ThreadPoolExecutor(max_workers=1)
+        self._dense_lut_future = None
+        self._dense_lut_ready.connect(self._on_dense_lut_ready)
+        
         # LUT 强度
         self.lut_strength = 1.0  # 默认100%
-        self.last_preview_strength = None  # 最近一次预览使用的强度
+        self._preview_cache = {}  # (图片代次, LUT, 强度, Debanding) -> 预览结果，更换图片时清空
+        self._lut_preview = None  # ((图片代次, LUT), 强度 1.0 的预览图 LUT 结果)，调整强度时直接混合
+        self._image_generation = 0  # 每次更换图片加一，用于识别并丢弃旧图片的预览结果
         
         # Debanding 选项
         self.debanding_enabled = False
@@ -54,24 +193,41 @@ class LutAppWindow(QMainWindow):
         self.config_file = os.path.join(self.lut_base_dir, '.lut_config.json')
         self.pinned_luts = self._load_config()
         
-        # 文件系统监视定时器
+        # 文件系统监视：目录变化由系统通知，短时间内的多次变化合并为一次刷新
         self.lut_refresh_timer = QTimer(self)
-        self.lut_refresh_timer.timeout.connect(self._refresh_lut_tree)
-        self.lut_refresh_timer.start(3000)  # 每3秒检查一次
-        self._last_lut_mtime = 0
-
-        # 预览与滑条强度同步定时器
-        self.preview_sync_timer = QTimer(self)
-        self.preview_sync_timer.setInterval(200)
-        self.preview_sync_timer.timeout.connect(self._ensure_preview_synced)
+        self.lut_refresh_timer.setSingleShot(True)
+        self.lut_refresh_timer.setInterval(300)
+        self.lut_refresh_timer.timeout.connect(self._load_lut_tree)
+        self._lut_watcher = QFileSystemWatcher(self)
+        self._lut_watcher.directoryChanged.connect(self.lut_refresh_timer.start)
+        self._tree_index = {}  # 路径 -> 树节点，刷新时据此只更新有变化的项
+        self._populated_dirs = set()  # 已展开过、子项已读取的文件夹；其余文件夹只有一个占位子项
+
+        # 预览防抖定时器：拖动滑条时只按最后一次的数值预览
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.setInterval(50)
+        self._preview_debounce.timeout.connect(self._on_preview_debounce)
+        self._pending_preview = None  # 线程运行期间推迟的预览：None 表示没有，否则为其 silent 参数
 
         self._init_ui()
         self._apply_theme()
-        self.preview_sync_timer.start()
         
         # 启用拖放功能
         self.setAcceptDrops(True)
 
+        # 空闲时预热编解码等首次调用较慢的代码路径
+        QTimer.singleShot(0, self._warmup)
+
+    def _warmup(self):
+        """用小尺寸图像预先跑一遍编解码与 Debanding 滤波，消除首次点击时的初始化延迟"""
+        dummy = np.zeros((64, 64, 3), np.uint8)
+        for ext in ('.png', '.jpg'):
+            ok, buffer = cv2.imencode(ext, dummy)
+            if ok:
+                cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+        apply_edge_preserving_debanding(dummy)
+
     def _init_ui(self):
         """初始化 UI 布局"""
         central_widget = QWidget()
@@ -97,6 +253,7 @@ class LutAppWindow(QMainWindow):
         self.lut_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.lut_tree.customContextMenuRequested.connect(self.on_lut_context_menu)
         self.lut_tree.itemDoubleClicked.connect(self.on_lut_double_clicked)
+        self.lut_tree.itemExpanded.connect(self._on_folder_expanded)
 
         lut_btn_layout = QHBoxLayout()
         self.btn_add_lut = QPushButton("添加LUT")
@@ -205,114 +362,13 @@ class LutAppWindow(QMainWindow):
 
     def _apply_theme(self):
         """应用暗色系样式表"""
-        self.setStyleSheet("""
-            QMainWindow { background-color: #1e1e1e; }
-            QWidget { color: #e0e0e0; font-family: 'Segoe UI', sans-serif; }
-
-            QPushButton {
-                background-color: #3a3a3a;
-                border: 1px solid #555;
-                border-radius: 6px;
-                color: #ffffff;
-                font-size: 14px;
-                padding: 0 15px;
-            }
-            QPushButton:hover { background-color: #4a4a4a; border-color: #666; }
-            QPushButton:pressed { background-color: #2a2a2a; border-color: #444; }
-            QPushButton:disabled { background-color: #252525; color: #666; border-color: #333; }
-
-            QTreeWidget {
-                background-color: #252526;
-                border: 1px solid #333;
-                border-radius: 6px;
-                color: #e0e0e0;
-                padding: 4px;
-                outline: none;
-                show-decoration-selected: 0;
-            }
-            QTreeWidget::item { 
-                padding: 6px 4px;
-                border-radius: 3px;
-                outline: none;
-                border: none;
-            }
-            QTreeWidget::item:selected { 
-                background-color: #3a3a3a; 
-                color: #ffffff; 
-                outline: none;
-                border: none;
-            }
-            QTreeWidget::item:focus {
-                background-color: #3a3a3a;
-                outline: none;
-                border: none;
-            }
-            QTreeWidget::item:hover { 
-                background-color: #333; 
-            }
-            QTreeWidget::branch {
-                background: transparent;
-            }
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {
-                border-image: none;
-                image: none;
-            }
-            QTreeWidget::branch:open:has-children:!has-siblings,
-            QTreeWidget::branch:open:has-children:has-siblings {
-                border-image: none;
-                image: none;
-            }
-            QTreeWidget::branch:has-siblings:!adjoins-item {
-                border-image: none;
-            }
-            QTreeWidget::branch:has-siblings:adjoins-item {
-                border-image: none;
-            }
-            QTreeWidget::branch:!has-children:!has-siblings:adjoins-item {
-                border-image: none;
-            }
-            
-            QSlider::groove:horizontal {
-                border: 1px solid #333;
-                height: 6px;
-                background: #2b2b2b;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #4a9eff;
-                border: 1px solid #3a8eef;
-                width: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #5aafff;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4a9eff;
-                border: 1px solid #333;
-                height: 6px;
-                border-radius: 3px;
-            }
+        self.setStyleSheet(_QSS_DARK)
 
-            QTextEdit {
-                background-color: #252526;
-                border: 1px solid #333;
-                border-radius: 4px;
-                color: #cccccc;
-                font-family: Consolas, monospace;
-            }
-
-            /* 滚动条样式优化 */
-            QScrollBar:vertical {
-                border: none; background: #2b2b2b; width: 10px; margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #555; min-height: 20px; border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
-        """)
+    def closeEvent(self, event):
+        """关闭窗口时取消尚未开始的后台解码"""
+        self._decode_pool.shutdown(wait=False, cancel_futures=True)
+        self._lut_bake_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
 
     def log(self, message):
         """向日志区域添加信息"""
@@ -371,26 +427,23 @@ class LutAppWindow(QMainWindow):
         _, ext = os.path.splitext(file_path)
         return ext.lower() == '.cube'
     
-    def _load_images_from_paths(self, file_paths: list):
-        """从文件路径加载图片"""
+    def _load_images_from_paths(self, file_paths: list, dropped=True):
+        """
+        从文件路径加载图片。
+        dropped 为 True 时来自拖放，已加载 LUT 时自动预览；为 False 时来自“打开图像”对话框。
+        """
         try:
             self.image_paths = file_paths
-            self.loaded_images = []
+            self.batch_save_dir = None
             
             # 加载第一张图片用于预览
-            data = np.fromfile(file_paths[0], dtype=np.uint8)
-            image = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
-
-            if image is None:
-                raise ValueError("文件解码失败或格式不支持")
-
-            # 移除可能存在的 Alpha 通道，简化处理
-            if image.shape[-1] == 4:
-                image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
-
-            self.source_image = image
+            self.source_image = self._start_decoding(file_paths)
+            self.preview_source = self._make_preview_source(self.source_image)
+            self._image_generation += 1
+            self._preview_cache.clear()
+            self._lut_preview = None
+            self.processed_image = None
             self.lbl_source.set_image(self.source_image)
-            self.last_preview_strength = None  # 重新加载图片后重置预览状态
             
             # 显示LUT强度滑块和debanding选项
             self.lbl_strength_title.setVisible(True)
@@ -402,25 +455,49 @@ class LutAppWindow(QMainWindow):
             if len(file_paths) > 1:
                 self.batch_mode = True
                 self.btn_preview.setVisible(True)
-                self.log(f"已拖放 {len(file_paths)} 张图像，显示第一张预览")
+                self.log(f"已{'拖放' if dropped else '选择'} {len(file_paths)} 张图像，显示第一张预览")
+                if not dropped:
+                    self.log("提示：点击'预览效果'查看第一张图片的LUT效果")
             else:
                 self.batch_mode = False
                 self.btn_preview.setVisible(False)
-                self.log(f"已拖放图像: {os.path.basename(file_paths[0])}")
+                self.log(f"已{'拖放' if dropped else '加载'}图像: {os.path.basename(file_paths[0])}")
             
-            # 如果已加载LUT，自动预览
-            if self.lut_table is not None:
+            # 拖放时如果已加载LUT，自动预览
+            if dropped and self.lut_table is not None:
                 self._apply_lut_preview()
 
         except Exception as e:
             self.log(f"[错误] 加载图像失败: {e}")
     
+    def _start_decoding(self, file_paths: list):
+        """
+        提交前若干张图片到后台解码，返回第一张图片用于预览。
+        只预解码前 _DECODE_AHEAD 张，其余由批处理线程按需读取，
+        避免超大批量时所有解码结果同时驻留内存。
+        """
+        for future in self._decode_futures:
+            if future is not None:
+                future.cancel()
+        self._decode_futures = [
+            self._decode_pool.submit(load_image, path) if i < _DECODE_AHEAD else None
+            for i, path in enumerate(file_paths)
+        ]
+        return self._decode_futures[0].result()
+    
+    def _make_preview_source(self, image, max_side=1024):
+        """将图像缩小到最长边不超过 max_side，用于实时预览"""
+        h, w = image.shape[:2]
+        scale = max_side / max(h, w)
+        if scale >= 1:
+            return image
+        return cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+    
     def _load_lut_from_path(self, file_path: str):
         """从文件路径加载 LUT"""
         try:
-            self.lut_table, self.lut_size = parse_cube_lut(file_path)
+            self._set_current_lut(file_path)
             self.log(f"已拖放 LUT: {os.path.basename(file_path)} (尺寸: {self.lut_size}^3)")
-            self.last_preview_strength = None  # 新 LUT 需重新预览
             
             # 如果已加载图像，自动预览
             if self.source_image is not None:
@@ -428,16 +505,47 @@ class LutAppWindow(QMainWindow):
         except Exception as e:
             self.log(f"[错误] 加载 LUT 失败: {e}")
 
+    def _set_current_lut(self, file_path: str):
+        """
+        解析 LUT 文件，并在后台读取或预计算 8-bit 稠密查找表。
+        查找表就绪前 dense_lut 为 None，处理回退到 Pillow 滤镜，结果与查表一致。
+        """
+        lut_table, lut_size = load_cube_lut(file_path, self.lut_cache_dir)
+        self.lut_table, self.lut_size, self.dense_lut = lut_table, lut_size, None
+        self.lut_key = (file_path, os.stat(file_path).st_mtime_ns)
+
+        if self._dense_lut_future is not None:
+            self._dense_lut_future.cancel()  # 尚未开始的旧 LUT 任务无需执行
+        self._dense_lut_future = self._lut_bake_pool.submit(
+            load_dense_lut, file_path, lut_table, lut_size, self.lut_cache_dir
+        )
+        self._dense_lut_future.add_done_callback(
+            lambda future, key=self.lut_key: self._dense_lut_ready.emit(key, future)
+        )
+
+    @Slot(object, object)
+    def _on_dense_lut_ready(self, lut_key, future):
+        """稠密查找表生成完成；期间已切换到其他 LUT 时丢弃结果"""
+        if future.cancelled() or lut_key != self.lut_key:
+            return
+        try:
+            self.dense_lut = future.result()
+        except Exception as e:
+            self.log(f"[警告] 预计算查找表失败，将直接使用 LUT 插值: {e}")
+
     # ==================== LUT 管理 ====================
 
     def _ensure_lut_dirs(self):
-        """确保 LUT 基础目录和自定义目录存在"""
+        """确保 LUT 基础目录、自定义目录和缓存目录存在"""
         base_dir = os.path.join(os.path.dirname(__file__), "LUT")
         custom_dir = os.path.join(base_dir, "Custom")
+        cache_dir = os.path.join(base_dir, ".cache")  # 稠密查找表缓存，隐藏目录不会出现在列表中
         os.makedirs(base_dir, exist_ok=True)
         os.makedirs(custom_dir, exist_ok=True)
+        os.makedirs(cache_dir, exist_ok=True)
         self.lut_base_dir = base_dir
         self.custom_lut_dir = custom_dir
+        self.lut_cache_dir = cache_dir
     
     def _load_config(self):
         """加载配置文件（置顶列表）"""
@@ -460,143 +568,136 @@ class LutAppWindow(QMainWindow):
             self.log(f"[错误] 保存配置失败: {e}")
 
     def _load_lut_tree(self):
-        """加载LUT树状结构（文件夹+文件）"""
-        # 保存当前展开状态
-        expanded_paths = self._get_expanded_paths()
-        
-        self.lut_tree.clear()
-        if not os.path.isdir(self.lut_base_dir):
-            return
-        
-        # 添加根目录的内容（置顶项会在目录内排在前面）
-        self._add_directory_contents(self.lut_tree, self.lut_base_dir, self.lut_base_dir)
-        
-        # 恢复展开状态
-        self._restore_expanded_paths(expanded_paths)
-    
-    def _get_expanded_paths(self):
-        """获取当前所有展开的文件夹路径"""
-        expanded = set()
-        
-        def collect_expanded(item):
-            if item.isExpanded():
-                path = item.data(0, Qt.UserRole)
-                item_type = item.data(0, Qt.UserRole + 2)
-                if path and item_type == "folder":
-                    expanded.add(path)
-            
-            for i in range(item.childCount()):
-                collect_expanded(item.child(i))
-        
-        root = self.lut_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            collect_expanded(root.child(i))
-        
-        return expanded
-    
-    def _restore_expanded_paths(self, expanded_paths):
-        """恢复文件夹的展开状态"""
-        if not expanded_paths:
-            return
-        
-        def restore_item(item):
-            path = item.data(0, Qt.UserRole)
-            item_type = item.data(0, Qt.UserRole + 2)
-            
-            if path in expanded_paths and item_type == "folder":
-                item.setExpanded(True)
-            
-            for i in range(item.childCount()):
-                restore_item(item.child(i))
-        
-        root = self.lut_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            restore_item(root.child(i))
+        """加载LUT树状结构（文件夹+文件），只对有变化的项增删或移动，展开状态随节点保留"""
+        # 批量修改期间暂停重绘和信号，避免每改动一项都触发一次布局刷新
+        self.lut_tree.setUpdatesEnabled(False)
+        self.lut_tree.blockSignals(True)
+        try:
+            root = self.lut_tree.invisibleRootItem()
+            seen = set()
+            if os.path.isdir(self.lut_base_dir):
+                # 添加根目录的内容（置顶项会在目录内排在前面）
+                self._add_directory_contents(root, self.lut_base_dir, seen)
+            else:
+                root.takeChildren()
+
+            # 已不在磁盘上的路径，其节点已随父节点一并移除
+            for path in self._tree_index.keys() - seen:
+                del self._tree_index[path]
+            self._populated_dirs &= self._tree_index.keys()
+        finally:
+            self.lut_tree.blockSignals(False)
+            self.lut_tree.setUpdatesEnabled(True)
+            self._sync_lut_watcher()
     
-    def _add_directory_contents(self, parent, dir_path, base_path):
-        """递归添加目录内容"""
+    def _add_directory_contents(self, parent, dir_path, seen):
+        """递归同步目录内容：按目标顺序复用已有节点，只新建、移动或移除有变化的项"""
+        # os.scandir 读取目录时已带回条目类型，分类时无需再逐个 stat
         try:
-            items = os.listdir(dir_path)
+            with os.scandir(dir_path) as it:
+                dir_entries = [entry for entry in it if not entry.name.startswith('.')]  # 过滤隐藏文件
         except PermissionError:
             return
         
-        # 过滤隐藏文件
-        items = [item for item in items if not item.startswith('.')]
-        
         # 分类：文件夹和文件
-        folders = []
-        files = []
-        
-        for item_name in items:
-            item_path = os.path.join(dir_path, item_name)
-            
-            if os.path.isdir(item_path):
-                folders.append((item_name, item_path))
-            elif item_name.lower().endswith('.cube'):
-                files.append((item_name, item_path))
+        folders = [(e.name, e.path) for e in dir_entries if e.is_dir()]
+        files = [(e.name, e.path) for e in dir_entries if not e.is_dir() and e.name.lower().endswith('.cube')]
         
         # 按名称排序
         folders.sort(key=lambda x: x[0].lower())
         files.sort(key=lambda x: x[0].lower())
         
-        # 分离置顶和非置顶文件
-        pinned_files = [(name, path) for name, path in files if path in self.pinned_luts]
-        unpinned_files = [(name, path) for name, path in files if path not in self.pinned_luts]
-        
-        # 先添加置顶文件
-        for item_name, item_path in pinned_files:
-            self._add_file_item(parent, item_path, is_pinned=True)
-        
-        # 再添加非置顶文件
-        for item_name, item_path in unpinned_files:
-            self._add_file_item(parent, item_path, is_pinned=False)
-        
-        # 最后添加文件夹（并递归处理其内容）
-        for item_name, item_path in folders:
-            folder_item = QTreeWidgetItem(parent, [f"📁 {item_name}"])
-            folder_item.setData(0, Qt.UserRole, item_path)
-            folder_item.setData(0, Qt.UserRole + 1, False)  # is_pinned
-            folder_item.setData(0, Qt.UserRole + 2, "folder")
-            folder_item.setExpanded(False)
+        # 一次遍历分离置顶和非置顶文件
+        pinned_files, unpinned_files = [], []
+        for _, path in files:
+            (pinned_files if path in self.pinned_luts else unpinned_files).append(path)
+        
+        # 目标顺序：置顶文件、非置顶文件、文件夹
+        entries = [(path, "file", True) for path in pinned_files]
+        entries += [(path, "file", False) for path in unpinned_files]
+        entries += [(path, "folder", False) for _, path in folders]
+        
+        for row, (item_path, item_type, is_pinned) in enumerate(entries):
+            seen.add(item_path)
+            item = self._tree_index.get(item_path)
+            if item is not None and item.data(0, Qt.UserRole + 2) != item_type:
+                # 同名路径由文件变为文件夹（或相反），丢弃旧节点
+                parent.removeChild(item)
+                item = None
+            
+            if item is None:
+                item = self._new_folder_item(item_path) if item_type == "folder" else self._new_file_item(item_path)
+                parent.insertChild(row, item)
+                self._tree_index[item_path] = item
+            elif (index := parent.indexOfChild(item)) != row:
+                # 移动节点时保持其展开状态
+                expanded = item.isExpanded()
+                parent.takeChild(index)
+                parent.insertChild(row, item)
+                item.setExpanded(expanded)
             
-            # 递归添加子内容
-            self._add_directory_contents(folder_item, item_path, base_path)
+            if item_type == "file":
+                if item.data(0, Qt.UserRole + 1) != is_pinned:
+                    self._set_file_item_pinned(item, is_pinned)
+            elif item_path in self._populated_dirs:
+                # 递归同步子内容；未展开过的文件夹保留占位项，展开时再读取
+                self._add_directory_contents(item, item_path, seen)
+        
+        # 目标项都已排在前面，其余即为磁盘上已不存在的项
+        while parent.childCount() > len(entries):
+            parent.removeChild(parent.child(len(entries)))
     
-    def _add_file_item(self, parent, file_path, is_pinned=False):
-        """添加文件项"""
-        file_name = os.path.basename(file_path)
-        pin_icon = "📌 " if is_pinned else ""
-        display_name = f"{pin_icon}🎬 {file_name}"
+    def _new_folder_item(self, folder_path):
+        """创建文件夹项"""
+        folder_item = QTreeWidgetItem([f"📁 {os.path.basename(folder_path)}"])
+        folder_item.setData(0, Qt.UserRole, folder_path)
+        folder_item.setData(0, Qt.UserRole + 1, False)  # is_pinned
+        folder_item.setData(0, Qt.UserRole + 2, "folder")
+        QTreeWidgetItem(folder_item, ["…"])  # 占位子项，使文件夹显示展开箭头
+        return folder_item
+    
+    @Slot(QTreeWidgetItem)
+    def _on_folder_expanded(self, item):
+        """文件夹第一次展开时才读取其内容"""
+        path = item.data(0, Qt.UserRole)
+        if item.data(0, Qt.UserRole + 2) != "folder" or path in self._populated_dirs:
+            return
         
-        item = QTreeWidgetItem(parent, [display_name])
+        self._populated_dirs.add(path)
+        self.lut_tree.setUpdatesEnabled(False)
+        try:
+            item.takeChildren()  # 移除占位项
+            self._add_directory_contents(item, path, set())
+        finally:
+            self.lut_tree.setUpdatesEnabled(True)
+        self._sync_lut_watcher()
+    
+    def _new_file_item(self, file_path):
+        """创建文件项"""
+        item = QTreeWidgetItem()
         item.setData(0, Qt.UserRole, file_path)
-        item.setData(0, Qt.UserRole + 1, is_pinned)
         item.setData(0, Qt.UserRole + 2, "file")
+        self._set_file_item_pinned(item, False)
+        return item
     
-    def _refresh_lut_tree(self):
-        """检查文件系统变化并刷新树"""
-        try:
-            current_mtime = self._get_dir_mtime(self.lut_base_dir)
-            if current_mtime != self._last_lut_mtime:
-                self._last_lut_mtime = current_mtime
-                self._load_lut_tree()
-        except:
-            pass
+    def _set_file_item_pinned(self, item, is_pinned):
+        """更新文件项的置顶标记和显示名称"""
+        file_name = os.path.basename(item.data(0, Qt.UserRole))
+        pin_icon = "📌 " if is_pinned else ""
+        item.setText(0, f"{pin_icon}🎬 {file_name}")
+        item.setData(0, Qt.UserRole + 1, is_pinned)
     
-    def _get_dir_mtime(self, dir_path):
-        """递归获取目录的最后修改时间"""
-        try:
-            mtime = os.path.getmtime(dir_path)
-            for root, dirs, files in os.walk(dir_path):
-                for d in dirs:
-                    if not d.startswith('.'):
-                        mtime = max(mtime, os.path.getmtime(os.path.join(root, d)))
-                for f in files:
-                    if f.endswith('.cube'):
-                        mtime = max(mtime, os.path.getmtime(os.path.join(root, f)))
-            return mtime
-        except:
-            return 0
+    def _sync_lut_watcher(self):
+        """让文件系统监视覆盖根目录和已读取内容的文件夹，新增的加入、已删除的移除"""
+        folders = set(self._populated_dirs)
+        if os.path.isdir(self.lut_base_dir):
+            folders.add(self.lut_base_dir)
+
+        watched = set(self._lut_watcher.directories())
+        if watched - folders:
+            self._lut_watcher.removePaths(list(watched - folders))
+        if folders - watched:
+            self._lut_watcher.addPaths(list(folders - watched))
 
     @Slot()
     def on_add_lut(self):
@@ -647,6 +748,7 @@ class LutAppWindow(QMainWindow):
             return
 
         try:
+            self._remove_lut_caches(path)
             os.remove(path)
             self.pinned_luts.discard(path)
             self._save_config()
@@ -655,6 +757,18 @@ class LutAppWindow(QMainWindow):
         except Exception as e:
             self.log(f"[错误] 删除失败: {e}")
 
+    def _remove_lut_caches(self, path):
+        """删除 LUT 文件（或文件夹内全部 LUT）的磁盘缓存，避免删除、重命名后留下无主的查找表"""
+        if os.path.isdir(path):
+            lut_paths = [
+                os.path.join(root, name)
+                for root, _, files in os.walk(path) for name in files if self._is_lut_file(name)
+            ]
+        else:
+            lut_paths = [path]
+        for lut_path in lut_paths:
+            remove_lut_caches(lut_path, self.lut_cache_dir)
+
     @Slot(object)
     def on_lut_double_clicked(self, item, column):
         """双击加载LUT（仅文件）"""
@@ -666,7 +780,7 @@ class LutAppWindow(QMainWindow):
             return
         
         try:
-            self.lut_table, self.lut_size = parse_cube_lut(path)
+            self._set_current_lut(path)
             self.log(f"已选择 LUT: {os.path.basename(path)} (尺寸: {self.lut_size}^3)")
             
             # 如果已加载图像，自动预览
@@ -761,6 +875,7 @@ class LutAppWindow(QMainWindow):
             return
         
         try:
+            self._remove_lut_caches(old_path)
             os.rename(old_path, new_path)
             
             # 更新置顶列表中的路径
@@ -794,55 +909,14 @@ class LutAppWindow(QMainWindow):
             return
         
         try:
+            self._remove_lut_caches(old_path)
             os.rename(old_path, new_path)
             
-            # 更新置顶列表中所有受影响的路径
-            updated_pinned = set()
-            for pinned_path in self.pinned_luts:
-                if pinned_path.startswith(old_path + os.sep):
-                    new_pinned = pinned_path.replace(old_path, new_path, 1)
-                    updated_pinned.add(new_pinned)
-                else:
-                    updated_pinned.add(pinned_path)
-            self.pinned_luts = updated_pinned
-            self._save_config()
-            
-            self._load_lut_tree()
-            self.log(f"文件夹重命名成功: {old_name} → {new_name}")
-        except Exception as e:
-            self.log(f"[错误] 重命名失败: {e}")
-    
-    def on_rename_folder(self, old_path):
-        """重命名文件夹"""
-        old_name = os.path.basename(old_path)
-        
-        new_name, ok = QInputDialog.getText(
-            self, "重命名文件夹", "输入新名称:",
-            text=old_name
-        )
-        
-        if not ok or not new_name.strip():
-            return
-        
-        new_name = new_name.strip()
-        new_path = os.path.join(os.path.dirname(old_path), new_name)
-        
-        if os.path.exists(new_path):
-            self.log(f"[错误] 文件夹名已存在: {new_name}")
-            return
-        
-        try:
-            os.rename(old_path, new_path)
-            
-            # 更新置顶列表中所有受影响的路径
-            updated_pinned = set()
-            for pinned_path in self.pinned_luts:
-                if pinned_path.startswith(old_path + os.sep):
-                    new_pinned = pinned_path.replace(old_path, new_path, 1)
-                    updated_pinned.add(new_pinned)
-                else:
-                    updated_pinned.add(pinned_path)
-            self.pinned_luts = updated_pinned
+            # 更新置顶列表中所有受影响的路径（一次遍历重建集合）
+            prefix = old_path + os.sep
+            self.pinned_luts = {
+                new_path + p[len(old_path):] if p.startswith(prefix) else p for p in self.pinned_luts
+            }
             self._save_config()
             
             self._load_lut_tree()
@@ -857,6 +931,7 @@ class LutAppWindow(QMainWindow):
             return
         
         try:
+            self._remove_lut_caches(path)
             os.remove(path)
             
             # 从置顶列表中移除
@@ -864,7 +939,7 @@ class LutAppWindow(QMainWindow):
             self._save_config()
             
             self.log(f"已删除 LUT: {os.path.basename(path)}")
-            self._load_lut_list()
+            self._load_lut_tree()
         except Exception as e:
             self.log(f"[错误] 删除失败: {e}")    
     def on_delete_folder(self, path):
@@ -874,6 +949,7 @@ class LutAppWindow(QMainWindow):
             return
         
         try:
+            self._remove_lut_caches(path)
             shutil.rmtree(path)
             
             # 从置顶列表中移除所有相关路径
@@ -892,9 +968,8 @@ class LutAppWindow(QMainWindow):
         self.lut_strength = value / 100.0
         self.lbl_strength_value.setText(f"{value}%")
         
-        # 如果已加载图像和LUT，则实时预览
-        if self.source_image is not None and self.lut_table is not None:
-            self._apply_lut_preview(silent=True)
+        # 重新计时，连续拖动只在停顿后预览一次
+        self._preview_debounce.start()
     
     @Slot(int)
     def on_debanding_changed(self, state):
@@ -909,41 +984,61 @@ class LutAppWindow(QMainWindow):
     def _apply_lut_preview(self, silent=False):
         """应用LUT到当前图像（实时预览）"""
         if hasattr(self, 'worker_thread') and self.worker_thread and self.worker_thread.isRunning():
-            return  # 如果有线程正在运行，跳过
+            # 有线程正在运行：记下待预览，线程结束后按最新参数再预览（非静默请求优先）
+            self._pending_preview = silent and self._pending_preview is not False
+            return
 
+        self._render_preview(silent)
+
+    def _render_preview(self, silent):
+        """按当前参数生成预览：优先使用缓存结果，只改变强度时直接混合，否则启动后台线程"""
         # 捕获当前滑条强度，避免线程处理中途滑条变化导致不一致
         strength = self.lut_strength
         debanding = self.debanding_enabled
 
+        # 相同参数已预览过时直接使用缓存结果
+        cache_key = (self._image_generation, self.lut_key, strength, debanding)
+        if cache_key in self._preview_cache:
+            self.on_preview_finished(self._preview_cache[cache_key], silent)
+            return
+
+        # 已有当前 LUT 的完全应用结果时无需再查表；不启用 Debanding 时只需一次混合，直接在界面线程完成
+        lut_result = None
+        if self._lut_preview is not None and self._lut_preview[0] == cache_key[:2]:
+            lut_result = self._lut_preview[1]
+            if not debanding:
+                result_image = finish_lut_result(self.preview_source, lut_result, strength)
+                self.on_preview_finished(result_image, silent, cache_key)
+                return
+
         # 创建新线程前，确保旧线程已被正确清理
         if hasattr(self, 'worker_thread') and self.worker_thread:
             self.worker_thread.deleteLater()
 
         self.worker_thread = ImageProcessingThread(
-            self.source_image, self.lut_table, self.lut_size, strength, debanding
+            self.preview_source, self.lut_table, self.lut_size, strength, debanding, self.dense_lut, lut_result,
+            self.lbl_result.display_max_side()
         )
         self.worker_thread.processing_finished.connect(
-            lambda img, s=strength: self.on_preview_finished(img, silent, s)
+            lambda img, k=cache_key, t=self.worker_thread:
+                self.on_preview_finished(img, silent, k, t.lut_result, t.display_image)
         )
         self.worker_thread.processing_error.connect(self.on_process_error)
+        self.worker_thread.finished.connect(self._on_worker_finished)
         self.worker_thread.start()
 
-    def _ensure_preview_synced(self):
-        """定时校验预览结果与滑条强度是否一致，不一致则触发预览"""
-        # 未加载图片或LUT、强度控制未显示时跳过
-        if not (self.source_image is not None and self.lut_table is not None):
-            return
-        if not self.strength_slider.isVisible():
-            return
-
-        # 正在处理时跳过，避免争抢线程
-        if hasattr(self, 'worker_thread') and self.worker_thread and self.worker_thread.isRunning():
+    @Slot()
+    def _on_worker_finished(self):
+        """后台线程结束后，执行运行期间被推迟的预览"""
+        if self._pending_preview is None:
             return
+        silent, self._pending_preview = self._pending_preview, None
+        if self.source_image is not None and self.lut_table is not None:
+            self._apply_lut_preview(silent)
 
-        current_strength = self.lut_strength
-
-        # 还未做过任何预览，或当前预览强度与滑条不一致时，触发一次静默预览
-        if self.last_preview_strength is None or abs(current_strength - self.last_preview_strength) > 1e-4:
+    def _on_preview_debounce(self):
+        """防抖计时结束后，按当前参数静默预览"""
+        if self.source_image is not None and self.lut_table is not None:
             self._apply_lut_preview(silent=True)
 
     @Slot()
@@ -953,53 +1048,15 @@ class LutAppWindow(QMainWindow):
             "Images (*.png *.jpg *.jpeg *.bmp *.tif *.tiff *.webp)"
         )
         if file_paths:
-            try:
-                self.image_paths = file_paths
-                self.loaded_images = []
-                
-                # 加载第一张图片用于预览
-                data = np.fromfile(file_paths[0], dtype=np.uint8)
-                image = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
-
-                if image is None:
-                    raise ValueError("文件解码失败或格式不支持")
-
-                # 移除可能存在的 Alpha 通道，简化处理
-                if image.shape[-1] == 4:
-                    image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
-
-                self.source_image = image
-                self.lbl_source.set_image(self.source_image)
-                self.last_preview_strength = None  # 重新加载图片后重置预览状态
-                
-                # 显示LUT强度滑块和debanding选项
-                self.lbl_strength_title.setVisible(True)
-                self.strength_slider.setVisible(True)
-                self.lbl_strength_value.setVisible(True)
-                self.chk_debanding.setVisible(True)
-                
-                # 判断是否为批处理模式
-                if len(file_paths) > 1:
-                    self.batch_mode = True
-                    self.btn_preview.setVisible(True)
-                    self.log(f"已选择 {len(file_paths)} 张图像，显示第一张预览")
-                    self.log("提示：点击'预览效果'查看第一张图片的LUT效果")
-                else:
-                    self.batch_mode = False
-                    self.btn_preview.setVisible(False)
-                    self.log(f"已加载图像: {os.path.basename(file_paths[0])}")
-
-            except Exception as e:
-                self.log(f"[错误] 加载图像失败: {e}")
+            self._load_images_from_paths(file_paths, dropped=False)
 
     @Slot()
     def on_open_lut(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "选择 LUT 文件", "", "LUT Files (*.cube)")
         if file_path:
             try:
-                self.lut_table, self.lut_size = parse_cube_lut(file_path)
+                self._set_current_lut(file_path)
                 self.log(f"已加载 LUT: {os.path.basename(file_path)} (尺寸: {self.lut_size}^3)")
-                self.last_preview_strength = None  # 新 LUT 需重新预览
                 
                 # 如果已加载图像，自动预览
                 if self.source_image is not None:
@@ -1021,24 +1078,34 @@ class LutAppWindow(QMainWindow):
         self.btn_preview.setText("预览中...")
         self.log("正在预览第一张图片的效果...")
         
-        # 启动后台线程处理预览
-        strength = self.lut_strength
-        debanding = self.debanding_enabled
-        self.worker_thread = ImageProcessingThread(
-            self.source_image, self.lut_table, self.lut_size, strength, debanding
-        )
-        self.worker_thread.processing_finished.connect(
-            lambda img, s=strength: self.on_preview_finished(img, False, s)
-        )
-        self.worker_thread.processing_error.connect(self.on_process_error)
-        self.worker_thread.start()
+        # 有线程正在运行（如批处理）时不等待，线程结束后再预览
+        self._apply_lut_preview(silent=False)
     
     @Slot(object)
-    def on_preview_finished(self, result_image, silent=False, applied_strength=None):
+    def on_preview_finished(self, result_image, silent=False, cache_key=None, lut_result=None, display_image=None):
         """预览完成"""
-        self.processed_image = result_image
-        self.lbl_result.set_image(self.processed_image)
-        self.last_preview_strength = applied_strength if applied_strength is not None else self.lut_strength
+        if cache_key is not None and cache_key[0] != self._image_generation:
+            # 更换图片前启动的预览，结果属于旧图片，直接丢弃
+            self.btn_preview.setEnabled(True)
+            self.btn_preview.setText("预览效果")
+            return
+
+        if lut_result is not None and lut_result.shape == self.preview_source.shape:
+            self._lut_preview = (cache_key[:2], lut_result)
+        if cache_key is not None:
+            self._preview_cache[cache_key] = result_image
+            if len(self._preview_cache) > 32:
+                self._preview_cache.pop(next(iter(self._preview_cache)))  # 淘汰最早的结果
+
+        # 预览基于缩小图像，不作为导出结果；参数已变化，旧的原图处理结果随之失效
+        self.processed_image = None
+        self.lbl_result.set_image(result_image, display_image)
+
+        # 处理期间参数又有变化时，按最新参数再预览一次
+        if cache_key is not None and cache_key != (
+            self._image_generation, self.lut_key, self.lut_strength, self.debanding_enabled
+        ):
+            self._preview_debounce.start()
         
         if not silent:
             debanding_status = "✓ 已启用" if self.debanding_enabled else "✗ 未启用"
@@ -1056,6 +1123,17 @@ class LutAppWindow(QMainWindow):
             self.log("[警告] 请先加载 LUT 文件")
             return
 
+        if self.batch_mode:
+            # 批处理结果逐张写盘，开始前先选择保存文件夹
+            save_dir = QFileDialog.getExistingDirectory(
+                self, "选择保存文件夹", "",
+                QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
+            )
+            if not save_dir:
+                self.log("已取消批量处理")
+                return
+            self.batch_save_dir = save_dir
+
         self.btn_process.setEnabled(False)
         self.btn_process.setText("正在处理...")
         
@@ -1071,26 +1149,37 @@ class LutAppWindow(QMainWindow):
             from lut_processing import BatchProcessingThread
             
             self.worker_thread = BatchProcessingThread(
-                self.image_paths, self.lut_table, self.lut_size, self.lut_strength, self.debanding_enabled
+                self.image_paths, self.batch_save_dir, self.lut_table, self.lut_size, self.lut_strength,
+                self.debanding_enabled, self.dense_lut, self._decode_futures, self.lbl_result.display_max_side()
             )
+            # 解码任务交给批处理线程，之后更换图片时不会取消本批次仍要读取的任务
+            self._decode_futures = []
             self.worker_thread.progress_update.connect(self.on_batch_progress)
+            self.worker_thread.preview_ready.connect(
+                lambda img, t=self.worker_thread: self.on_batch_preview(img, t.display_image)
+            )
             self.worker_thread.processing_finished.connect(self.on_batch_finished)
             self.worker_thread.processing_error.connect(self.on_process_error)
+            self.worker_thread.finished.connect(self._on_worker_finished)
             self.worker_thread.start()
         else:
             # 单张处理模式
             self.log("开始应用 3D LUT，请稍候...")
             self.worker_thread = ImageProcessingThread(
-                self.source_image, self.lut_table, self.lut_size, self.lut_strength, self.debanding_enabled
+                self.source_image, self.lut_table, self.lut_size, self.lut_strength, self.debanding_enabled,
+                self.dense_lut, display_max_side=self.lbl_result.display_max_side()
+            )
+            self.worker_thread.processing_finished.connect(
+                lambda img, t=self.worker_thread: self.on_process_finished(img, t.display_image)
             )
-            self.worker_thread.processing_finished.connect(self.on_process_finished)
             self.worker_thread.processing_error.connect(self.on_process_error)
+            self.worker_thread.finished.connect(self._on_worker_finished)
             self.worker_thread.start()
 
     @Slot(object)
-    def on_process_finished(self, result_image):
+    def on_process_finished(self, result_image, display_image=None):
         self.processed_image = result_image
-        self.lbl_result.set_image(self.processed_image)
+        self.lbl_result.set_image(self.processed_image, display_image)
         debanding_status = "✓ 已启用" if self.debanding_enabled else "✗ 未启用"
         self.log(f"处理完成 [Debanding: {debanding_status}]")
         self._reset_process_btn()
@@ -1100,21 +1189,18 @@ class LutAppWindow(QMainWindow):
         """批处理进度更新"""
         self.log(message)
     
-    @Slot(list)
-    def on_batch_finished(self, processed_images):
-        """批处理完成"""
-        self.loaded_images = processed_images
-        
-        # 显示第一张处理后的图片
-        if processed_images:
-            self.processed_image = processed_images[0]
-            self.lbl_result.set_image(self.processed_image)
-        
-        self.log(f"批量处理完成！共处理 {len(processed_images)} 张图片")
+    @Slot(object)
+    def on_batch_preview(self, result_image, display_image=None):
+        """显示第一张处理后的图片"""
+        self.processed_image = result_image
+        self.lbl_result.set_image(self.processed_image, display_image)
+
+    @Slot(int)
+    def on_batch_finished(self, success_count):
+        """批处理完成，结果已在处理过程中逐张保存"""
+        self.log(f"批量处理完成！成功保存 {success_count}/{len(self.image_paths)} 张图片")
+        self.log(f"保存位置: {self.batch_save_dir}")
         self._reset_process_btn()
-        
-        # 自动弹出保存对话框
-        self.on_batch_save()
 
     @Slot(str)
     def on_process_error(self, error_msg):
@@ -1127,9 +1213,12 @@ class LutAppWindow(QMainWindow):
 
     @Slot()
     def on_save_result(self):
-        if self.batch_mode and self.loaded_images:
-            # 批处理模式，调用批量保存
-            self.on_batch_save()
+        if self.batch_mode:
+            # 批处理模式，结果在处理时已直接写入保存文件夹
+            if self.batch_save_dir:
+                self.log(f"批量处理结果已保存至: {self.batch_save_dir}")
+            else:
+                self.log("[警告] 批处理结果会在'应用处理'时直接保存，请先点击'应用处理'")
         elif self.processed_image is not None:
             # 单张保存模式
             file_path, _ = QFileDialog.getSaveFileName(
@@ -1146,57 +1235,15 @@ class LutAppWindow(QMainWindow):
                         file_path += ".png"
                         ext = ".png"
 
-                    # 使用 imencode 处理中文路径保存
-                    is_success, buffer = cv2.imencode(ext, self.processed_image)
-                    if is_success:
-                        with open(file_path, "wb") as f:
-                            buffer.tofile(f)
+                    # 与批处理共用 save_image（imencode + tofile，支持中文路径）
+                    if save_image(file_path, self.processed_image, ext):
                         self.log(f"已保存至: {file_path}")
                     else:
                         self.log("[错误] 图像编码失败")
                 except Exception as e:
                     self.log(f"[错误] 保存失败: {e}")
         else:
-            self.log("[警告] 没有可保存的处理结果")
-    
-    def on_batch_save(self):
-        """批量保存处理后的图片"""
-        if not self.loaded_images:
-            self.log("[警告] 没有可保存的处理结果")
-            return
-        
-        # 选择保存文件夹
-        save_dir = QFileDialog.getExistingDirectory(
-            self, "选择保存文件夹", "",
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
-        )
-        
-        if save_dir:
-            try:
-                success_count = 0
-                for i, (img, original_path) in enumerate(zip(self.loaded_images, self.image_paths)):
-                    # 获取原文件名
-                    base_name = os.path.basename(original_path)
-                    name, ext = os.path.splitext(base_name)
-                    
-                    # 生成新文件名（添加_lut后缀）
-                    new_name = f"{name}_lut{ext}"
-                    save_path = os.path.join(save_dir, new_name)
-                    
-                    # 保存图片
-                    is_success, buffer = cv2.imencode(ext if ext else '.png', img)
-                    if is_success:
-                        with open(save_path, "wb") as f:
-                            buffer.tofile(f)
-                        success_count += 1
-                    else:
-                        self.log(f"[错误] 编码失败: {base_name}")
-                
-                self.log(f"批量保存完成！成功保存 {success_count}/{len(self.loaded_images)} 张图片")
-                self.log(f"保存位置: {save_dir}")
-                
-            except Exception as e:
-                self.log(f"[错误] 批量保存失败: {e}")
+            self.log("[警告] 没有可保存的处理结果，请先点击'应用处理'")
 
 
 if __name__ == "__main__":
@@ -3,11 +3,12 @@ GUI 自定义组件模块
 包含自动缩放图像标签等控件
 """
 
-import cv2
 from PySide6.QtWidgets import QLabel, QSizePolicy
-from PySide6.QtGui import QImage, QPixmap, QPainter
+from PySide6.QtGui import QPixmap, QPainter
 from PySide6.QtCore import Qt
 
+from qt_image_utils import make_display_image
+
 
 class AutoResizingLabel(QLabel):
     """
@@ -30,22 +31,29 @@ class AutoResizingLabel(QLabel):
         # 忽略内容尺寸，允许布局管理器自由压缩或拉伸此控件
         self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self._pixmap = None
+        self._image = None  # 当前显示的图像，用于跳过重复设置
+        self._scaled_pixmap = None  # (控件尺寸, 缩放后的 Pixmap)，尺寸或图像变化时重建
+
+    def display_max_side(self):
+        """控件尺寸不会超过屏幕，显示用图像的最长边以屏幕物理像素为上限"""
+        screen = self.screen()
+        return int(max(screen.size().width(), screen.size().height()) * screen.devicePixelRatio())
 
-    def set_image(self, cv_img):
+    def set_image(self, cv_img, display_image=None):
         """
         设置要显示的 OpenCV 图像。
+        display_image 为后台线程用 make_display_image 预先生成的 QImage，提供时直接使用。
         """
-        if cv_img is None:
+        if cv_img is None or cv_img is self._image:
             return
+        self._image = cv_img
 
-        # BGR -> RGB -> QImage -> QPixmap
-        rgb = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        bytes_per_line = ch * w
-        qimg = QImage(rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
+        if display_image is None:
+            display_image = make_display_image(cv_img, self.display_max_side())
 
-        # 保存原始分辨率的 Pixmap，用于动态重绘
-        self._pixmap = QPixmap.fromImage(qimg)
+        # 保存 Pixmap，用于动态重绘
+        self._pixmap = QPixmap.fromImage(display_image)
+        self._scaled_pixmap = None
         self.update()  # 触发 paintEvent
 
     def paintEvent(self, event):
@@ -59,11 +67,13 @@ class AutoResizingLabel(QLabel):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)  # 开启平滑抗锯齿
 
-        # 计算适应当前窗口的尺寸 (保持纵横比)
+        # 计算适应当前窗口的尺寸 (保持纵横比)，尺寸不变时复用上次的缩放结果
         target_size = self.size()
-        scaled_pixmap = self._pixmap.scaled(
-            target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        if self._scaled_pixmap is None or self._scaled_pixmap[0] != target_size:
+            self._scaled_pixmap = (target_size, self._pixmap.scaled(
+                target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            ))
+        scaled_pixmap = self._scaled_pixmap[1]
 
         # 计算居中坐标
         x = (target_size.width() - scaled_pixmap.width()) // 2
@@ -3,48 +3,48 @@ LUT 处理核心模块
 包含 LUT 文件解析和图像处理功能
 """
 
+import os
+import glob
+import hashlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+
 import cv2
 import numpy as np
 from PIL import Image, ImageFilter
 from PySide6.QtCore import QThread, Signal
 
+from qt_image_utils import make_display_image
+
 
 # ==================== 蓝噪声贴图生成 ====================
 def _generate_blue_noise_texture(size=256, seed=42):
     """
     生成固定的蓝噪声贴图（平铺用）。
-    使用 Poisson Disk Sampling 的简化版本生成蓝噪声。
-    
+    对白噪声做频域高通整形：FFT 后按径向频率加权，再逆变换回空间域，
+    能量集中在高频，平铺时也不会出现低频团块。
+
     Args:
         size: 贴图大小 (size x size)
         seed: 随机种子，保证可重现性
-    
+
     Returns:
         shape (size, size) 的蓝噪声贴图，值域 [-0.5, 0.5]
     """
-    np.random.seed(seed)
-    
-    # 使用高频 Perlin-like 噪声生成蓝噪声的近似
-    # 方法：多个正弦波频率叠加形成蓝噪声特性
-    x = np.linspace(0, 4 * np.pi, size)
-    y = np.linspace(0, 4 * np.pi, size)
-    xx, yy = np.meshgrid(x, y)
-    
-    # 多频率组合形成蓝噪声
-    noise = np.sin(xx) * np.cos(yy) * 0.3
-    noise += np.sin(xx * 0.7) * np.cos(yy * 0.9) * 0.3
-    noise += np.sin(xx * 1.3) * np.cos(yy * 1.1) * 0.2
-    noise += np.sin(xx * 2.1) * np.cos(yy * 1.7) * 0.2
-    
-    # 添加小幅随机扰动以增加蓝噪声特性
-    random_noise = (np.random.uniform(-1, 1, (size, size)) * 0.1)
-    noise = noise + random_noise
-    
+    rng = np.random.default_rng(seed)
+    white = rng.standard_normal((size, size))
+
+    # 径向频率 |f| 作为高通权重；FFT 天然周期，结果可无缝平铺
+    freq = np.fft.fftfreq(size)
+    radius = np.sqrt(freq[None, :] ** 2 + freq[:, None] ** 2)
+    noise = np.fft.ifft2(np.fft.fft2(white) * radius).real
+
     # 归一化到 [-0.5, 0.5]
     noise_min = noise.min()
     noise_max = noise.max()
     noise = (noise - noise_min) / (noise_max - noise_min) - 0.5
-    
+
     return noise.astype(np.float32)
 
 
@@ -63,35 +63,39 @@ def _apply_blue_noise_dither(image, intensity=1.5):
     Returns:
         抖动后的图像 (uint8)
     """
-    img_float = image.astype(np.float32)
-    h, w, c = img_float.shape
-    
-    # 将蓝噪声贴图平铺到图像大小
+    h, w = image.shape[:2]
+
+    # 强度先乘到 256x256 的贴图上，只沿宽度平铺一次；逐个贴图高度的行带处理，
+    # 抖动图按广播加到各通道，无需整幅的平铺图和 3 通道浮点副本
     texture_h, texture_w = _BLUE_NOISE_TEXTURE.shape
-    dither_map = np.tile(_BLUE_NOISE_TEXTURE, (h // texture_h + 1, w // texture_w + 1))[:h, :w]
-    
-    # 扩展到3通道
-    dither_map_3ch = np.stack([dither_map] * c, axis=-1)
-    
-    # 应用抖动
-    dithered = img_float + dither_map_3ch * intensity
-    
-    return np.clip(dithered, 0, 255).astype(np.uint8)
+    row_map = np.tile(_BLUE_NOISE_TEXTURE * np.float32(intensity), (1, w // texture_w + 1))[:, :w, None]
+
+    result = np.empty_like(image)
+    band = np.empty((texture_h,) + image.shape[1:], dtype=np.float32)  # 各行带复用的浮点缓冲区
+    for y in range(0, h, texture_h):
+        rows = image[y:y + texture_h]
+        dithered = band[:rows.shape[0]]
+        np.add(rows, row_map[:rows.shape[0]], out=dithered)
+        np.clip(dithered, 0, 255, out=dithered)
+        result[y:y + texture_h] = dithered  # 截断为 uint8
+
+    return result
 
 
 # ==================== LUT 解析 ====================
 def parse_cube_lut(file_path):
     """
     解析 .cube 格式的 3D LUT 文件。
+    逐行只识别头部关键字，数据行拼接后由 np.fromstring 一次性解析，无需逐个调用 float()。
 
     Args:
         file_path (str): .cube 文件路径
 
     Returns:
-        tuple: (lut_table_list, size)
-               lut_table_list 为扁平化的浮点列表，size 为 LUT 的维度 (N)
+        tuple: (lut_table, size)
+               lut_table 为扁平化的 float64 数组，size 为 LUT 的维度 (N)
     """
-    lut_table = []
+    data_lines = []
     size = 0
 
     try:
@@ -105,15 +109,15 @@ def parse_cube_lut(file_path):
                 if line.startswith('LUT_3D_SIZE'):
                     size = int(line.split()[-1])
                     continue
-                # 解析数据点 (检查是否以数字或负号开头)
+                # 收集数据点 (检查是否以数字或负号开头)
                 if line[0].isdigit() or line[0] == '-':
-                    parts = line.split()
-                    lut_table.extend([float(v) for v in parts])
+                    data_lines.append(line)
 
         if size == 0:
             raise ValueError("未找到 LUT_3D_SIZE 定义")
-        if len(lut_table) != size * size * size * 3:
-            raise ValueError(f"数据点数量不匹配。预期: {size ** 3 * 3}, 实际: {len(lut_table)}")
+        lut_table = np.fromstring(' '.join(data_lines), dtype=np.float64, sep=' ')
+        if lut_table.size != size * size * size * 3:
+            raise ValueError(f"数据点数量不匹配。预期: {size ** 3 * 3}, 实际: {lut_table.size}")
 
         return lut_table, size
 
@@ -125,51 +129,363 @@ def parse_cube_lut(file_path):
         raise ValueError("文件编码格式不支持")
 
 
-# ==================== Debanding ====================
+def _cache_key(file_path):
+    """源文件绝对路径的哈希，作为其全部缓存文件名的前缀"""
+    return hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+
+
+def _cache_paths(file_path, cache_dir, suffix):
     """
-    解析 .cube 格式的 3D LUT 文件。
+    生成源文件对应的缓存文件路径。
+    文件名包含源文件的路径哈希、修改时间和大小，源文件变化后自动失效。
 
     Args:
-        file_path (str): .cube 文件路径
+        file_path (str): 源文件路径
+        cache_dir (str): 缓存目录
+        suffix (str): 缓存文件后缀
 
     Returns:
-        tuple: (lut_table_list, size)
-               lut_table_list 为扁平化的浮点列表，size 为 LUT 的维度 (N)
+        tuple: (缓存文件路径, 匹配同一源文件全部缓存的 glob 模式)
     """
-    lut_table = []
-    size = 0
+    st = os.stat(file_path)
+    path_key = _cache_key(file_path)
+    cache_path = os.path.join(cache_dir, f"{path_key}_{st.st_mtime_ns}_{st.st_size}{suffix}")
+    return cache_path, os.path.join(cache_dir, f"{path_key}_*{suffix}")
 
+
+def _save_cache(cache_path, stale_pattern, array):
+    """清理同一源文件的旧缓存，先写临时文件再替换，避免留下不完整的缓存"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # 跳过空行和注释
-                if not line or line.startswith('#'):
-                    continue
-                # 解析尺寸定义
-                if line.startswith('LUT_3D_SIZE'):
-                    size = int(line.split()[-1])
-                    continue
-                # 解析数据点 (检查是否以数字或负号开头)
-                if line[0].isdigit() or line[0] == '-':
-                    parts = line.split()
-                    lut_table.extend([float(v) for v in parts])
+        for stale in glob.glob(stale_pattern):
+            os.remove(stale)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # 缓存写入失败不影响本次使用
 
-        if size == 0:
-            raise ValueError("未找到 LUT_3D_SIZE 定义")
-        if len(lut_table) != size * size * size * 3:
-            raise ValueError(f"数据点数量不匹配。预期: {size ** 3 * 3}, 实际: {len(lut_table)}")
 
-        return lut_table, size
+def remove_lut_caches(file_path, cache_dir):
+    """
+    删除 LUT 文件的全部磁盘缓存（解析结果与稠密查找表），LUT 被删除或重命名时调用。
+    只按路径匹配，源文件已不存在时也可调用。
 
-    except UnicodeDecodeError:
-        # 尝试使用 latin-1 再次读取，防止某些特殊编码文件报错
-        with open(file_path, 'r', encoding='latin-1') as f:
-            # 简化重复逻辑，实际生产中可封装
-            pass
-        raise ValueError("文件编码格式不支持")
+    Args:
+        file_path (str): .cube 文件路径
+        cache_dir (str): 缓存目录
+    """
+    for path in glob.glob(os.path.join(cache_dir, f"{_cache_key(file_path)}_*")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # 缓存正被使用等情况，下次清理
+
+
+@lru_cache(maxsize=32)
+def _load_cube_lut_cached(file_path, mtime_ns, file_size, cache_dir):
+    """按 (路径, 修改时间, 文件大小) 缓存解析结果，文件变化后键随之改变"""
+    if cache_dir is not None:
+        cache_path, stale_pattern = _cache_paths(file_path, cache_dir, '.cube.npy')
+        if os.path.exists(cache_path):
+            try:
+                lut_table = np.load(cache_path)
+                return lut_table, round((lut_table.size // 3) ** (1 / 3))
+            except (OSError, ValueError):
+                pass  # 缓存损坏，重新解析
+
+    lut_table, size = parse_cube_lut(file_path)
+    if cache_dir is not None:
+        _save_cache(cache_path, stale_pattern, lut_table)
+    return lut_table, size
+
+
+def load_cube_lut(file_path, cache_dir=None):
+    """
+    解析 .cube 格式的 3D LUT 文件，重复加载未修改的文件时直接返回缓存结果。
+    提供 cache_dir 时解析结果另存为 .npy，之后启动程序也无需重新解析文本。
+
+    Args:
+        file_path (str): .cube 文件路径
+        cache_dir (str): 缓存目录，为 None 时只在内存中缓存
+
+    Returns:
+        tuple: (lut_table, size)，lut_table 为扁平化的 float64 数组，size 为 LUT 的维度 (N)
+    """
+    st = os.stat(file_path)
+    return _load_cube_lut_cached(os.path.abspath(file_path), st.st_mtime_ns, st.st_size, cache_dir)
+
+
+# ==================== 图像读取 ====================
+# 让解码器直接输出 3 通道 BGR：Alpha 通道在解码时丢弃，无需再分配 4 通道缓冲区后转换；
+# 忽略 EXIF 方向，与原先 IMREAD_UNCHANGED 的读取结果保持一致
+_IMREAD_FLAGS = cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION
+
+
+def load_image(file_path):
+    """
+    读取图像文件，返回 OpenCV BGR 格式的图像，并移除 Alpha 通道。
+    ASCII 路径直接用 cv2.imread 读取；含中文等非 ASCII 字符的路径
+    cv2.imread 无法打开，改用 np.fromfile + cv2.imdecode。
+
+    Args:
+        file_path (str): 图像文件路径
+
+    Returns:
+        OpenCV BGR 格式的图像
+    """
+    if file_path.isascii():
+        # 解码器直接读取文件，省去额外的整文件缓冲区拷贝
+        image = cv2.imread(file_path, _IMREAD_FLAGS)
+    else:
+        data = np.fromfile(file_path, dtype=np.uint8)
+        image = cv2.imdecode(data, _IMREAD_FLAGS)
+
+    if image is None:
+        raise ValueError(f"文件解码失败或格式不支持: {os.path.basename(file_path)}")
+
+    return image
 
 
+def save_image(file_path, image, ext=None):
+    """
+    编码并保存图像，使用 cv2.imencode + tofile 以支持中文路径。
+
+    Args:
+        file_path (str): 保存路径
+        image: OpenCV BGR 格式的图像
+        ext (str): 编码格式（如 '.png'），默认取保存路径的后缀
+
+    Returns:
+        bool: 编码是否成功
+    """
+    is_success, buffer = cv2.imencode(ext or os.path.splitext(file_path)[1], image)
+    if is_success:
+        buffer.tofile(file_path)
+    return is_success
+
+
+# ==================== 8-bit 稠密 LUT ====================
+def _build_lut_filter(lut_table, lut_size):
+    """构建 Pillow 的 3D LUT 滤镜"""
+    return ImageFilter.Color3DLUT(
+        size=lut_size,
+        table=lut_table,
+        channels=3,
+        target_mode=None
+    )
+
+
+def _bake_dense_lut_rows(grid_rows, lut_filter, out_rows):
+    """对颜色网格的一段连续行执行 Pillow 滤镜，结果按 BGR 顺序写入 out_rows"""
+    processed = np.asarray(Image.fromarray(grid_rows).filter(lut_filter))
+    out_rows[..., :3] = processed[..., ::-1]
+
+
+def build_dense_lut(lut_table, lut_size):
+    """
+    将 3D LUT 预计算为覆盖全部 8-bit 输入的稠密查找表。
+    对包含全部 256³ 种颜色的图像执行一次三线性插值，
+    之后每张 uint8 图像只需一次查表，无需再逐像素插值。
+    Pillow 滤镜执行时会释放 GIL，网格按行分块在查表线程池上并行处理。
+
+    Args:
+        lut_table: LUT 数据表
+        lut_size: LUT 维度大小
+
+    Returns:
+        shape (256, 256, 256, 4) 的 uint8 数组，按 [R, G, B] 索引，输出为 BGR 顺序，
+        第 4 个字节为填充，使每项正好 4 字节，查表时可按 uint32 一次读取
+    """
+    # 构造包含全部 256³ 种颜色的 4096x4096 RGB 图像
+    values = np.arange(256, dtype=np.uint8)
+    grid = np.empty((256, 256, 256, 3), dtype=np.uint8)
+    grid[..., 0] = values[:, None, None]
+    grid[..., 1] = values[None, :, None]
+    grid[..., 2] = values[None, None, :]
+
+    grid = grid.reshape(4096, 4096, 3)
+
+    # 输出通道 RGB -> BGR，与 OpenCV 图像保持一致
+    dense_lut = np.zeros((256, 256, 256, 4), dtype=np.uint8)
+    out = dense_lut.reshape(4096, 4096, 4)
+
+    lut_filter = _build_lut_filter(lut_table, lut_size)
+    band = -(-4096 // _LUT_WORKERS)  # 每个线程负责的行数（向上取整）
+    futures = [
+        _LUT_POOL.submit(_bake_dense_lut_rows, grid[y:y + band], lut_filter, out[y:y + band])
+        for y in range(0, 4096, band)
+    ]
+    for future in futures:
+        future.result()
+
+    return dense_lut
+
+
+# 可分离 LUT 的一维查找表形状，可直接用于 cv2.LUT
+_CHANNEL_LUT_SHAPE = (256, 1, 3)
+
+# 一维恒等查找表，用于把强度混合折算进可分离 LUT
+_IDENTITY_CHANNEL_LUT = np.repeat(np.arange(256, dtype=np.uint8).reshape(256, 1, 1), 3, axis=2)
+
+
+def _matches_channel_luts(table, channel_luts):
+    """检查稠密查找表（或其采样）的每个输出通道是否只由对应输入通道的一维表决定"""
+    shape = table.shape[:3]
+    # 稠密表按 [R, G, B] 索引，输出为 BGR：B 沿第 3 轴变化，G 沿第 2 轴，R 沿第 1 轴
+    return (np.array_equal(table[..., 0], np.broadcast_to(channel_luts[None, None, :, 0, 0], shape))
+            and np.array_equal(table[..., 1], np.broadcast_to(channel_luts[None, :, None, 0, 1], shape))
+            and np.array_equal(table[..., 2], np.broadcast_to(channel_luts[:, None, None, 0, 2], shape)))
+
+
+def _extract_channel_luts(dense_lut):
+    """
+    判断稠密查找表是否可分离：每个输出通道只取决于对应的输入通道。
+    曲线、色阶类的 LUT 通常可分离，此时三张 256 项的一维表即可精确表示，
+    可直接交给 cv2.LUT，比 256³ 查表快得多。
+
+    Args:
+        dense_lut: build_dense_lut 生成的稠密查找表
+
+    Returns:
+        可分离时返回 shape (256, 1, 3) 的 uint8 一维查找表（BGR 顺序），否则返回 None
+    """
+    channel_luts = np.empty(_CHANNEL_LUT_SHAPE, dtype=np.uint8)
+    channel_luts[:, 0, 0] = dense_lut[0, 0, :, 0]
+    channel_luts[:, 0, 1] = dense_lut[0, :, 0, 1]
+    channel_luts[:, 0, 2] = dense_lut[:, 0, 0, 2]
+
+    # 先用稀疏采样快速排除常见的不可分离 LUT，再做完整校验
+    if not _matches_channel_luts(dense_lut[::15, ::15, ::15], channel_luts[::15]):
+        return None
+    return channel_luts if _matches_channel_luts(dense_lut, channel_luts) else None
+
+
+def is_channel_lut(dense_lut):
+    """判断 load_dense_lut 的返回值是否为可分离 LUT 的一维查找表"""
+    return dense_lut is not None and dense_lut.shape == _CHANNEL_LUT_SHAPE
+
+
+def blend_dense_lut(dense_lut, strength):
+    """
+    把强度混合折算进稠密查找表：与恒等表按强度混合后，查表一次即得到混合后的结果。
+    与先查表再混合图像逐位一致，批处理强度固定时每张图片都可省去一次整图混合。
+
+    Args:
+        dense_lut: build_dense_lut 生成的稠密查找表
+        strength: LUT 强度 (0.0-1.0)
+
+    Returns:
+        形状与 dense_lut 相同的新查找表
+    """
+    values = np.arange(256, dtype=np.uint8)
+    identity = np.zeros((256, 256, 256, 4), dtype=np.uint8)
+    identity[..., 0] = values[None, None, :]
+    identity[..., 1] = values[None, :, None]
+    identity[..., 2] = values[:, None, None]
+
+    # 按 4096x4096 的 4 通道图像交给 cv2.addWeighted，与图像混合的运算顺序相同
+    blended = cv2.addWeighted(
+        identity.reshape(4096, 4096, 4), 1.0 - strength, np.asarray(dense_lut).reshape(4096, 4096, 4), strength, 0
+    )
+    return blended.reshape(dense_lut.shape)
+
+
+def load_dense_lut(file_path, lut_table, lut_size, cache_dir):
+    """
+    获取 LUT 对应的稠密查找表，优先以内存映射方式读取磁盘缓存。
+    缓存文件名包含 .cube 的路径哈希、修改时间和大小，文件变化后自动重建。
+
+    Args:
+        file_path (str): .cube 文件路径
+        lut_table: LUT 数据表
+        lut_size: LUT 维度大小
+        cache_dir (str): 缓存目录
+
+    Returns:
+        与 build_dense_lut 相同的稠密查找表；LUT 可分离时返回 (256, 1, 3) 的一维查找表
+    """
+    cache_path, stale_pattern = _cache_paths(file_path, cache_dir, '.lut256x4.npy')
+
+    if os.path.exists(cache_path):
+        try:
+            dense_lut = np.load(cache_path, mmap_mode='r')
+            channel_luts = _extract_channel_luts(dense_lut)
+            return dense_lut if channel_luts is None else channel_luts
+        except (OSError, ValueError):
+            pass  # 缓存损坏，重新计算
+
+    dense_lut = build_dense_lut(lut_table, lut_size)
+    _save_cache(cache_path, stale_pattern, dense_lut)
+
+    channel_luts = _extract_channel_luts(dense_lut)
+    return dense_lut if channel_luts is None else channel_luts
+
+
+# 查表线程池：NumPy 的索引计算和 gather 会释放 GIL，可按行分块多核并行
+_LUT_WORKERS = os.cpu_count() or 1
+_LUT_POOL = ThreadPoolExecutor(max_workers=_LUT_WORKERS)
+
+# 每个分块的像素数：分块内的通道平面和索引数组可留在 L2 缓存中
+_LUT_TILE_PIXELS = 1 << 18
+
+
+def _apply_dense_lut_rows(source_rows, table, out_rows):
+    """对一段连续行做查表，结果写入 out_rows"""
+    tile_rows = max(1, _LUT_TILE_PIXELS // source_rows.shape[1])
+    packed = np.empty((tile_rows, source_rows.shape[1]), dtype=np.uint32)  # 各分块复用的查表输出缓冲区
+    for y in range(0, source_rows.shape[0], tile_rows):
+        source_tile = source_rows[y:y + tile_rows]
+        _apply_dense_lut_tile(source_tile, table, packed[:source_tile.shape[0]], out_rows[y:y + tile_rows])
+
+
+def _apply_dense_lut_tile(source_tile, table, packed, out_tile):
+    """对单个分块做查表"""
+    # 先拆成连续的单通道平面，索引计算按顺序读取内存，避免跨步访问交错的 BGR
+    b, g, r = cv2.split(source_tile)
+
+    # 将 (R, G, B) 合成为扁平索引，一次 gather 得到全部输出
+    # 查找表每项为填充到 4 字节的 BGR，按 uint32 读取，每个像素只需一次对齐的标量读取
+    index = r.astype(np.uint32) << 16
+    index |= g.astype(np.uint32) << 8
+    index |= b
+    np.take(table, index, out=packed, mode='clip')
+
+    # 去掉填充字节，写回 3 通道输出
+    cv2.cvtColor(packed.view(np.uint8).reshape(*packed.shape, 4), cv2.COLOR_BGRA2BGR, dst=out_tile)
+
+
+def apply_dense_lut(source_img, dense_lut):
+    """
+    使用稠密查找表对 uint8 图像做查表映射，按行分块在多个线程上并行执行。
+
+    Args:
+        source_img: OpenCV BGR 格式 uint8 图像
+        dense_lut: load_dense_lut 返回的稠密查找表或可分离 LUT 的一维查找表
+
+    Returns:
+        映射后的 OpenCV BGR 格式图像 (uint8)
+    """
+    if is_channel_lut(dense_lut):
+        # 可分离 LUT：逐通道一维查表
+        return cv2.LUT(source_img, dense_lut)
+
+    table = np.asarray(dense_lut).reshape(-1, 4).view(np.uint32).reshape(-1)
+    result = np.empty(source_img.shape, dtype=np.uint8)
+
+    h = source_img.shape[0]
+    band = -(-h // _LUT_WORKERS)  # 每个线程负责的行数（向上取整）
+    futures = [
+        _LUT_POOL.submit(_apply_dense_lut_rows, source_img[y:y + band], table, result[y:y + band])
+        for y in range(0, h, band)
+    ]
+    for future in futures:
+        future.result()
+
+    return result
+
+
+# ==================== Debanding ====================
 def apply_edge_preserving_debanding(image):
     """
     使用 Domain Transform Filter 进行 Debanding 处理。
@@ -198,7 +514,7 @@ def apply_edge_preserving_debanding(image):
     return result
 
 
-def apply_lut_to_image(source_img, lut_table, lut_size, strength=1.0, debanding=False):
+def apply_lut_to_image(source_img, lut_table, lut_size, strength=1.0, debanding=False, dense_lut=None):
     """
     将 3D LUT 应用到图像上。
 
@@ -208,29 +524,55 @@ def apply_lut_to_image(source_img, lut_table, lut_size, strength=1.0, debanding=
         lut_size: LUT 维度大小
         strength: LUT 强度 (0.0-1.0)，1.0为完全应用
         debanding: 是否启用 Debanding 处理
+        dense_lut: build_dense_lut 预计算的稠密查找表，提供时 uint8 图像直接查表
 
     Returns:
         处理后的 OpenCV BGR 格式图像
     """
-    # 1. 颜色空间转换: OpenCV (BGR) -> Pillow (RGB)
-    img_rgb = cv2.cvtColor(source_img, cv2.COLOR_BGR2RGB)
-    pil_image = Image.fromarray(img_rgb)
+    if dense_lut is not None and source_img.dtype == np.uint8:
+        if is_channel_lut(dense_lut) and strength < 1.0:
+            # 1-5. 可分离 LUT：强度混合是逐通道的线性运算，可先作用在 256 项的一维表上，
+            # 查表一次即得到混合后的结果
+            table = cv2.addWeighted(_IDENTITY_CHANNEL_LUT, 1.0 - strength, dense_lut, strength, 0)
+            return finish_lut_result(source_img, cv2.LUT(source_img, table), 1.0, debanding)
 
-    # 2. 构建 3D LUT 滤镜
-    lut_filter = ImageFilter.Color3DLUT(
-        size=lut_size,
-        table=lut_table,
-        channels=3,
-        target_mode=None
-    )
+        # 1-4. 8-bit 快速路径：直接查表，无需插值和颜色空间转换
+        result_bgr = apply_dense_lut(source_img, dense_lut)
+    else:
+        # 1. 颜色空间转换: OpenCV (BGR) -> Pillow (RGB)
+        img_rgb = cv2.cvtColor(source_img, cv2.COLOR_BGR2RGB)
+        pil_image = Image.fromarray(img_rgb)
 
-    # 3. 应用滤镜 (计算密集型步骤)
-    processed_pil = pil_image.filter(lut_filter)
+        # 2. 构建 3D LUT 滤镜
+        lut_filter = _build_lut_filter(lut_table, lut_size)
+
+        # 3. 应用滤镜 (计算密集型步骤)
+        processed_pil = pil_image.filter(lut_filter)
+
+        # 4. 转换回 OpenCV 格式: Pillow (RGB) -> OpenCV (BGR)
+        processed_np = np.asarray(processed_pil)
+        result_bgr = cv2.cvtColor(processed_np, cv2.COLOR_RGB2BGR)
+
+    return finish_lut_result(source_img, result_bgr, strength, debanding)
+
+
+def finish_lut_result(source_img, lut_result, strength=1.0, debanding=False):
+    """
+    对完全应用 LUT 的结果做强度混合与 Debanding。
+    强度只是原图与 LUT 结果的线性混合，缓存完全应用的结果后，
+    调整强度时只需重新执行这一步，无需再次查表。
+
+    Args:
+        source_img: 原始 OpenCV BGR 格式的图像
+        lut_result: 强度为 1.0 时 LUT 处理后的图像
+        strength: LUT 强度 (0.0-1.0)，1.0为完全应用
+        debanding: 是否启用 Debanding 处理
+
+    Returns:
+        处理后的 OpenCV BGR 格式图像
+    """
+    result_bgr = lut_result
 
-    # 4. 转换回 OpenCV 格式: Pillow (RGB) -> OpenCV (BGR)
-    processed_np = np.asarray(processed_pil)
-    result_bgr = cv2.cvtColor(processed_np, cv2.COLOR_RGB2BGR)
-    
     # 5. 根据强度混合原图和处理后的图
     if strength < 1.0:
         result_bgr = cv2.addWeighted(source_img, 1.0 - strength, result_bgr, strength, 0)
@@ -254,23 +596,39 @@ class ImageProcessingThread(QThread):
     processing_finished = Signal(object)  # 成功信号，携带处理后的 OpenCV 图像
     processing_error = Signal(str)  # 失败信号，携带错误信息
 
-    def __init__(self, source_img, lut_table, lut_size, strength=1.0, debanding=False):
+    def __init__(self, source_img, lut_table, lut_size, strength=1.0, debanding=False, dense_lut=None,
+                 lut_result=None, display_max_side=None):
         super().__init__()
         self.source_img = source_img
         self.lut_table = lut_table
         self.lut_size = lut_size
         self.strength = strength
         self.debanding = debanding
+        self.dense_lut = dense_lut
+        # 强度为 1.0 的 LUT 结果：传入时跳过查表，处理完成后可供调用方缓存复用
+        self.lut_result = lut_result
+        # 提供 display_max_side 时在本线程生成显示用 QImage，界面线程无需再缩放和转换
+        self.display_max_side = display_max_side
+        self.display_image = None
 
     def run(self):
         try:
-            result_bgr = apply_lut_to_image(
-                self.source_img, 
-                self.lut_table, 
-                self.lut_size,
-                self.strength,
-                self.debanding
-            )
+            if self.lut_result is None and is_channel_lut(self.dense_lut):
+                # 可分离 LUT 的查表与强度混合可合并为一次 cv2.LUT，无需保留中间结果
+                result_bgr = apply_lut_to_image(
+                    self.source_img, self.lut_table, self.lut_size, self.strength, self.debanding, self.dense_lut
+                )
+            else:
+                if self.lut_result is None:
+                    self.lut_result = apply_lut_to_image(
+                        self.source_img, 
+                        self.lut_table, 
+                        self.lut_size,
+                        dense_lut=self.dense_lut
+                    )
+                result_bgr = finish_lut_result(self.source_img, self.lut_result, self.strength, self.debanding)
+            if self.display_max_side:
+                self.display_image = make_display_image(result_bgr, self.display_max_side)
             self.processing_finished.emit(result_bgr)
 
         except Exception as e:
@@ -279,55 +637,113 @@ class ImageProcessingThread(QThread):
 
 class BatchProcessingThread(QThread):
     """
-    批量图像处理线程，用于处理多张图片。
+    批量图像处理线程，把每张图片的 解码→应用 LUT→编码写盘 作为一个任务分发到线程池。
+    OpenCV 解码/编码与 LUT 查表都会释放 GIL，多张图片可同时运行在不同核心上；
+    同一时刻最多只有 CPU 核数张图片在处理中，峰值内存与图片总数无关。
     """
-    processing_finished = Signal(list)  # 成功信号，携带处理后的图像列表
+    processing_finished = Signal(int)  # 成功信号，携带成功保存的数量
     processing_error = Signal(str)  # 失败信号，携带错误信息
     progress_update = Signal(str)  # 进度更新信号
-    
-    def __init__(self, image_paths, lut_table, lut_size, strength=1.0, debanding=False):
+    preview_ready = Signal(object)  # 第一张处理结果，用于界面显示
+
+    def __init__(self, image_paths, save_dir, lut_table, lut_size, strength=1.0, debanding=False,
+                 dense_lut=None, decode_futures=None, display_max_side=None):
         super().__init__()
         self.image_paths = image_paths
+        self.save_dir = save_dir
+        # 与 image_paths 一一对应的后台解码任务，取用后即置空以释放解码结果；
+        # 保存为独立的列表，界面之后更换图片时不会改动本批次的任务
+        self.decode_futures = list(decode_futures) if decode_futures else None
         self.lut_table = lut_table
         self.lut_size = lut_size
         self.strength = strength
         self.debanding = debanding
-    
+        self.dense_lut = dense_lut
+        self._preview_sent = False
+        self._preview_lock = threading.Lock()
+        # 第一张结果的显示用 QImage，在工作线程中生成
+        self.display_max_side = display_max_side
+        self.display_image = None
+
     def run(self):
         try:
-            processed_images = []
             total = len(self.image_paths)
-            
-            for i, img_path in enumerate(self.image_paths, 1):
-                try:
-                    # 加载图像
-                    data = np.fromfile(img_path, dtype=np.uint8)
-                    image = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
-                    
-                    if image is None:
-                        raise ValueError(f"文件解码失败: {img_path}")
-                    
-                    # 移除 Alpha 通道
-                    if len(image.shape) == 3 and image.shape[-1] == 4:
-                        image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
-                    
-                    # 应用 LUT
-                    result = apply_lut_to_image(image, self.lut_table, self.lut_size, self.strength, self.debanding)
-                    processed_images.append(result)
-                    
-                    # 发送进度更新
-                    import os
-                    filename = os.path.basename(img_path)
-                    self.progress_update.emit(f"[{i}/{total}] 处理完成: {filename}")
-                    
-                except Exception as e:
-                    self.progress_update.emit(f"[警告] 处理失败: {os.path.basename(img_path)} - {e}")
-                    continue
-            
-            if processed_images:
-                self.processing_finished.emit(processed_images)
+            max_workers = os.cpu_count() or 1
+
+            # 整批强度相同：先把混合折算进稠密查找表，每张图片只需查表
+            # （可分离 LUT 的一维表在 apply_lut_to_image 中已同样处理）
+            if self.strength < 1.0 and self.dense_lut is not None and not is_channel_lut(self.dense_lut):
+                self.dense_lut = blend_dense_lut(self.dense_lut, self.strength)
+                self.strength = 1.0
+            success_count = 0
+            done_count = 0
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {}
+                next_index = 0
+                while next_index < total or pending:
+                    # 限制处理中的图片数量，避免解码结果在内存中堆积
+                    while next_index < total and len(pending) < max_workers:
+                        future = executor.submit(self._process_one, next_index)
+                        pending[future] = os.path.basename(self.image_paths[next_index])
+                        next_index += 1
+
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        filename = pending.pop(future)
+                        done_count += 1
+                        try:
+                            if future.result():
+                                success_count += 1
+                                self.progress_update.emit(f"[{done_count}/{total}] 处理完成: {filename}")
+                            else:
+                                self.progress_update.emit(f"[错误] 编码失败: {filename}")
+                        except Exception as e:
+                            self.progress_update.emit(f"[警告] 处理失败: {filename} - {e}")
+
+            if success_count:
+                self.processing_finished.emit(success_count)
             else:
                 self.processing_error.emit("所有图片处理失败")
-                
+
         except Exception as e:
             self.processing_error.emit(f"批处理过程出错: {str(e)}")
+
+    def _process_one(self, index):
+        """
+        处理单张图片：解码、应用 LUT 并写入保存文件夹。
+
+        Args:
+            index (int): 图片在 image_paths 中的序号
+
+        Returns:
+            bool: 编码写入成功返回 True
+        """
+        img_path = self.image_paths[index]
+
+        # 加载图像（优先使用后台预解码结果）
+        future = self.decode_futures[index] if self.decode_futures else None
+        if future is not None:
+            image = future.result()
+            self.decode_futures[index] = None
+        else:
+            image = load_image(img_path)
+
+        # 应用 LUT
+        result = apply_lut_to_image(
+            image, self.lut_table, self.lut_size, self.strength, self.debanding, self.dense_lut
+        )
+        del image
+
+        with self._preview_lock:
+            send_preview = not self._preview_sent
+            self._preview_sent = True
+        if send_preview:
+            if self.display_max_side:
+                self.display_image = make_display_image(result, self.display_max_side)
+            self.preview_ready.emit(result)
+
+        # 生成新文件名（添加_lut后缀）
+        name, ext = os.path.splitext(os.path.basename(img_path))
+        save_path = os.path.join(self.save_dir, f"{name}_lut{ext}")
+        return save_image(save_path, result, ext if ext else '.png')
@@ -0,0 +1,32 @@
+"""
+Qt 图像辅助模块
+OpenCV 图像与 QImage 之间的转换，不涉及界面控件，可在后台线程调用
+"""
+
+import cv2
+import numpy as np
+from PySide6.QtGui import QImage
+
+
+def make_display_image(cv_img, max_side):
+    """
+    生成用于显示的 QImage：先把大图缩小到 max_side 再转换，减少拷贝和后续缩放的数据量。
+    不涉及界面对象，可在后台线程调用，界面线程只需再做一次 QPixmap.fromImage。
+
+    Args:
+        cv_img: OpenCV BGR 格式的图像
+        max_side (int): 最长边上限
+
+    Returns:
+        持有独立数据的 QImage
+    """
+    h, w = cv_img.shape[:2]
+    scale = max_side / max(h, w)
+    if scale < 1:
+        cv_img = cv2.resize(cv_img, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+
+    # BGR 缓冲区直接构造 QImage（Format_BGR888），无需 BGR -> RGB 转换
+    # QImage 不拷贝数据，复制一份使其不依赖 NumPy 缓冲区的生命周期
+    bgr = np.ascontiguousarray(cv_img)
+    h, w = bgr.shape[:2]
+    return QImage(bgr.data, w, h, bgr.strides[0], QImage.Format_BGR888).copy()